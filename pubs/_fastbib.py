@@ -0,0 +1,127 @@
+"""Fast single-pass parser for the bibtex that pubs itself writes.
+
+Each paper is stored in its own small bib file, so the full
+bibtexparser/pyparsing machinery is invoked once per paper and its
+startup cost is never amortized. Since we control the writer, the
+grammar of those files is tight::
+
+    @type{key,
+     field = {value},
+     ...
+    }
+
+and can be tokenized with a simple character scanner, orders of
+magnitude faster than the grammar-based parser. Anything outside this
+subset (quoted or bare values, string definitions, comments, ...)
+raises UnsupportedBibtex and the caller is expected to fall back to
+bibtexparser, so hand-edited files keep working unchanged.
+"""
+
+from __future__ import unicode_literals
+
+from collections import OrderedDict
+
+from bibtexparser.bparser import BibTexParser, STANDARD_TYPES
+
+
+# field name aliases, kept in sync with bibtexparser's homogenize_fields.
+_ALT_DICT = BibTexParser().alt_dict
+
+
+class UnsupportedBibtex(Exception):
+    """Raised for data outside the subset handled by this parser."""
+
+
+def decode(bibdata, customization=None):
+    """Parse bibtex data emitted by pubs' own writer.
+
+    Mirrors the behavior of bibtexparser with `common_strings=True` and
+    `homogenize_fields=True` on the supported subset: entry types and
+    field names are lowercased, field aliases are renamed, and the
+    customization function, if any, is applied to each record.
+
+    :param customization: function applied to each parsed record.
+    :return: an ordered dictionary of records, indexed by citekey.
+    :raise UnsupportedBibtex: if the data falls outside the subset;
+                              no error recovery should be attempted,
+                              only a full bibtexparser pass.
+    """
+    entries = OrderedDict()
+    s = bibdata
+    n = len(s)
+
+    def skip_whitespace(i):
+        while i < n and s[i] in ' \t\r\n':
+            i += 1
+        return i
+
+    i = skip_whitespace(0)
+    while i < n:
+        if s[i] != '@':
+            raise UnsupportedBibtex()
+        j = i + 1
+        while j < n and s[j].isalpha():
+            j += 1
+        entry_type = s[i + 1:j].lower()
+        if entry_type not in STANDARD_TYPES:
+            raise UnsupportedBibtex()
+        i = skip_whitespace(j)
+        if i >= n or s[i] != '{':
+            raise UnsupportedBibtex()
+        j = s.find(',', i + 1)
+        if j == -1 or '}' in s[i + 1:j]:
+            raise UnsupportedBibtex()
+        entry_id = s[i + 1:j].strip()
+        if not entry_id or any(c in entry_id for c in '{@"#'):
+            raise UnsupportedBibtex()
+        record = {}
+        i = skip_whitespace(j + 1)
+        while True:
+            if i >= n:
+                raise UnsupportedBibtex()
+            if s[i] == '}':
+                i += 1
+                break
+            j = i
+            while j < n and (s[j].isalnum() or s[j] in '_-'):
+                j += 1
+            if j == i:
+                raise UnsupportedBibtex()
+            field = s[i:j].lower()
+            i = skip_whitespace(j)
+            if i >= n or s[i] != '=':
+                raise UnsupportedBibtex()
+            i = skip_whitespace(i + 1)
+            if i >= n or s[i] != '{':
+                # quoted or bare values need string interpolation;
+                # that is the full parser's job.
+                raise UnsupportedBibtex()
+            depth, j = 1, i + 1
+            while j < n and depth > 0:
+                c = s[j]
+                if c == '{':
+                    depth += 1
+                elif c == '}':
+                    depth -= 1
+                elif c == '\n' or (c == '\\' and s[j + 1:j + 2] in '{}'):
+                    # multiline or escaped-brace values: bail out rather
+                    # than guess how the full parser would read them.
+                    raise UnsupportedBibtex()
+                j += 1
+            if depth > 0:
+                raise UnsupportedBibtex()
+            record[_ALT_DICT.get(field, field)] = s[i + 1:j - 1].strip()
+            i = skip_whitespace(j)
+            if i < n and s[i] == ',':
+                i = skip_whitespace(i + 1)
+            elif i >= n or s[i] != '}':
+                raise UnsupportedBibtex()
+        record['ENTRYTYPE'] = entry_type
+        record['ID'] = entry_id
+        if customization is not None:
+            record = customization(record)
+        entries[record['ID']] = record
+        i = skip_whitespace(i)
+    if len(entries) == 0:
+        raise UnsupportedBibtex()
+    return entries
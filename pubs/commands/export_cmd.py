@@ -42,19 +42,21 @@ def command(conf, args):
     ui = get_ui()
     rp = repo.Repository(conf)
 
-    papers = []
     if len(args.citekeys) < 1:
         papers = rp.all_papers()
     else:
-        for key in resolve_citekey_list(repo=rp, citekeys=args.citekeys, ui=ui, exit_on_fail=True):
-            papers.append(rp.pull_paper(key))
-
-    bib = {}
-    for p in papers:
-        bib[p.citekey] = p.bibdata
-
+        citekeys = resolve_citekey_list(repo=rp, citekeys=args.citekeys,
+                                        ui=ui, exit_on_fail=True)
+        # only the requested papers are touched; they are pulled lazily,
+        # in the citekey order the batch encoder used.
+        papers = (rp.pull_paper(key) for key in sorted(citekeys))
+
+    # Encoding and writing the papers one at a time keeps the memory
+    # footprint constant, whatever the size of the repository.
     exporter = endecoder.EnDecoder()
-    bibdata_raw = exporter.encode_bibdata(bib, args.ignore_fields)
-    ui.message(bibdata_raw)
+    for p in papers:
+        bibdata_raw = exporter.encode_bibdata({p.citekey: p.bibdata},
+                                              args.ignore_fields)
+        ui.message(bibdata_raw)
 
     rp.close()
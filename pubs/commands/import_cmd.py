@@ -102,16 +102,21 @@ def command(conf, args):
     # Extract papers from bib
     papers = many_from_path(ui, bibpath, ignore=args.ignore_malformed)
     keys = args.keys or papers.keys()
+    to_push = []
+    pushed_keys = set()
     for k in keys:
         p = papers[k]
-        try:
-            rp.push_paper(p, overwrite=args.overwrite)
-        except repo.CiteKeyCollision:
+        if p.citekey in pushed_keys or (
+                (not args.overwrite) and p.citekey in rp):
             ui.warning("{} already in repository, use '-O' to overwrite".format(
                     color.dye_out(p.citekey, 'citekey')
                 )
             )
             continue
+        to_push.append(p)
+        pushed_keys.add(p.citekey)
+    rp.push_papers(to_push, overwrite=args.overwrite)
+    for p in to_push:
         ui.info('{} imported.'.format(color.dye_out(p.citekey, 'citekey')))
         docfile = bibstruct.extract_docfile(p.bibdata)
         if docfile is None:
@@ -2,7 +2,7 @@ from __future__ import unicode_literals
 
 from . import filebroker
 from . import endecoder
-from .p3 import pickle
+from .p3 import pickle, uintern
 from . import __version__
 
 
@@ -74,8 +74,11 @@ class DataBroker(object):
         return self.filebroker.exists(citekey, meta_check=meta_check)
 
     def citekeys(self):
+        # citekeys end up duplicated in many places (papers, metadata,
+        # events, membership tests); interning them here, at their
+        # ingress point, makes all those copies share one string.
         listings = self.listing(filestats=False)
-        return set(listings['bibfiles'])
+        return set(uintern(citekey) for citekey in listings['bibfiles'])
 
     def listing(self, filestats=True):
         return self.filebroker.listing(filestats=filestats)
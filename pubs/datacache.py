@@ -98,6 +98,10 @@ class DataCache(object):
         self._databroker = None
         self._metacache = None
         self._bibcache = None
+        self._citekeys = None
+        self._citekeys_modified = False
+        self._bibnames = None
+        self._metanames = None
         if create:
             self._create()
 
@@ -131,6 +135,11 @@ class DataCache(object):
         """Write cache to disk"""
         self.metacache.flush(force=force)
         self.bibcache.flush(force=force)
+        if (force or self._citekeys_modified) and self._citekeys is not None:
+            self.databroker.push_cache('citekeys',
+                                       {'timestamp': time.time(),
+                                        'citekeys': self._citekeys})
+            self._citekeys_modified = False
 
     def pull_metadata(self, citekey):
         return self.metacache.pull(citekey)
@@ -140,25 +149,85 @@ class DataCache(object):
 
     def push_metadata(self, citekey, metadata):
         self.metacache.push(citekey, metadata)
+        if self._metanames is not None:
+            self._metanames.add(citekey)
 
     def push_bibentry(self, citekey, bibdata):
         self.bibcache.push(citekey, bibdata)
+        self._add_citekey(citekey)
 
     def push(self, citekey, metadata, bibdata):
         self.databroker.push(citekey, metadata, bibdata)
         self.metacache.push_to_cache(citekey, metadata)
         self.bibcache.push_to_cache(citekey, bibdata)
+        self._add_citekey(citekey)
+        if self._metanames is not None:
+            self._metanames.add(citekey)
 
     def remove(self, citekey):
         self.databroker.remove(citekey)
         self.metacache.remove_from_cache(citekey)
         self.bibcache.remove_from_cache(citekey)
+        self._remove_citekey(citekey)
 
     def exists(self, citekey, meta_check=False):
-        return self.databroker.exists(citekey, meta_check=meta_check)
+        """Existence check against an in-memory listing of the repository.
+
+        The bib and meta directories are scanned once; after that,
+        existence checks are set lookups and cost no syscall. The sets
+        are kept up to date by the push and remove methods.
+        """
+        if self._bibnames is None:
+            listing = self.databroker.listing(filestats=False)
+            self._bibnames = set(listing['bibfiles'])
+            self._metanames = set(listing['metafiles'])
+        exists = citekey in self._bibnames
+        if meta_check:
+            exists = exists and citekey in self._metanames
+        return exists
 
     def citekeys(self):
-        return self.databroker.citekeys()
+        """Return the set of citekeys, using a cached copy when possible.
+
+        Enumerating the citekeys requires listing every file of the
+        repository; the result is kept in a cache file, validated against
+        the modification time of the bib directory, so that warm
+        invocations do one file read instead of a full directory scan.
+        """
+        if self._citekeys is None:
+            self._citekeys = self._try_pull_citekeys()
+            if self._citekeys is None:
+                self._citekeys = self.databroker.citekeys()
+                self._citekeys_modified = True
+        return self._citekeys
+
+    def _try_pull_citekeys(self):
+        """Return the cached citekeys, or None if the cache is unusable."""
+        try:
+            cache = self.databroker.pull_cache('citekeys')
+            mtime = self.databroker.filebroker.mtime_bibdir()
+            nsec_support = os.stat('.').st_mtime != int(os.stat('.').st_mtime)
+            boundary = mtime if nsec_support else mtime + 1
+            if cache['timestamp'] >= boundary:
+                return cache['citekeys']
+        except Exception:  # take no prisonners; if something is wrong, no cache.
+            pass
+        return None
+
+    def _add_citekey(self, citekey):
+        if self._citekeys is not None:
+            self._citekeys.add(citekey)
+            self._citekeys_modified = True
+        if self._bibnames is not None:
+            self._bibnames.add(citekey)
+
+    def _remove_citekey(self, citekey):
+        if self._citekeys is not None:
+            self._citekeys.discard(citekey)
+            self._citekeys_modified = True
+        if self._bibnames is not None:
+            self._bibnames.discard(citekey)
+            self._metanames.discard(citekey)
 
     def listing(self, filestats=True):
         return self.databroker.listing(filestats=filestats)
@@ -18,6 +18,7 @@ except ImportError:
 
 import yaml
 
+from . import _fastbib
 from .bibstruct import TYPE_KEY
 
 """Important notice:
@@ -96,9 +97,9 @@ class EnDecoder(object):
     def encode_bibdata(self, bibdata, ignore_fields=[]):
         """Encode bibdata """
         bpdata = bp.bibdatabase.BibDatabase()
-        bpdata.entries = [self._entry_to_bp_entry(k, copy.copy(bibdata[k]),
+        bpdata.entries = [self._entry_to_bp_entry(k, copy.copy(entry),
                                                   ignore_fields=ignore_fields)
-                          for k in bibdata]
+                          for k, entry in bibdata.items()]
         return self.bwriter.write(bpdata)
 
     def _entry_to_bp_entry(self, key, entry, ignore_fields=[]):
@@ -128,9 +129,17 @@ class EnDecoder(object):
             error_msg = 'parsing error: the provided string has length zero.'
             raise self.BibDecodingError(error_msg, bibdata)
         try:
-            entries = bp.bparser.BibTexParser(
-                bibdata, common_strings=True, customization=customizations,
-                homogenize_fields=True).get_entry_dict()
+            try:
+                # files written by pubs itself follow a tight grammar
+                # that a simple scanner decodes much faster than the
+                # grammar-based parser below.
+                entries = _fastbib.decode(bibdata,
+                                          customization=customizations)
+            except _fastbib.UnsupportedBibtex:
+                entries = bp.bparser.BibTexParser(
+                    bibdata, common_strings=True,
+                    customization=customizations,
+                    homogenize_fields=True).get_entry_dict()
             # Remove id from bibtexparser attribute which is stored as citekey
             for e in entries:
                 entries[e].pop(BP_ID_KEY)
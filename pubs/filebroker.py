@@ -1,6 +1,6 @@
 import os
 import re
-from .p3 import urlparse, u_maybe
+from .p3 import urlparse, u_maybe, replace, scandir
 
 from .content import (check_file, check_directory, read_text_file, write_file,
                       system_path, check_content, copy_content)
@@ -62,8 +62,21 @@ class FileBroker(object):
         return content.read_binary_file(filepath)
 
     def push_cachefile(self, filename, data):
+        """Write a cache file atomically.
+
+        The data is written to a temporary file first, then moved in
+        place, so that an interrupted write cannot leave a truncated
+        cache behind.
+        """
         filepath = os.path.join(self.cachedir, filename)
-        write_file(filepath, data, mode='wb')
+        write_file(filepath + '.tmp', data, mode='wb')
+        replace(system_path(filepath + '.tmp'), system_path(filepath))
+
+    def mtime_bibdir(self):
+        try:
+            return os.path.getmtime(system_path(self.bibdir))
+        except OSError:
+            raise IOError("'{}' not found.".format(self.bibdir))
 
     def mtime_metafile(self, citekey):
         try:
@@ -118,23 +131,23 @@ class FileBroker(object):
         return does_exists
 
     def listing(self, filestats=True):
+        # scandir returns the file stats from the directory read
+        # itself, avoiding one stat call per file.
         metafiles = []
-        for filename in os.listdir(system_path(self.metadir)):
-            citekey = filter_filename(filename, META_EXT)
+        for direntry in scandir(system_path(self.metadir)):
+            citekey = filter_filename(direntry.name, META_EXT)
             if citekey is not None:
                 if filestats:
-                    stats = os.stat(system_path(os.path.join(self.metadir, filename)))
-                    metafiles.append(citekey, stats)
+                    metafiles.append((citekey, direntry.stat()))
                 else:
                     metafiles.append(citekey)
 
         bibfiles = []
-        for filename in os.listdir(system_path(self.bibdir)):
-            citekey = filter_filename(filename, BIB_EXT)
+        for direntry in scandir(system_path(self.bibdir)):
+            citekey = filter_filename(direntry.name, BIB_EXT)
             if citekey is not None:
                 if filestats:
-                    stats = os.stat(system_path(os.path.join(self.bibdir, filename)))
-                    bibfiles.append(citekey, stats)
+                    bibfiles.append((citekey, direntry.stat()))
                 else:
                     bibfiles.append(citekey)
 
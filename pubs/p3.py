@@ -1,4 +1,5 @@
 import io
+import os
 import sys
 import argparse
 
@@ -32,6 +33,58 @@ if sys.version_info[0] == 2:
             s = s.decode('utf-8')
         return s
 
+    def uintern(s):
+        """Intern the string if possible, return it unchanged otherwise"""
+        try:
+            return intern(s)
+        except TypeError:  # unicode strings cannot be interned in Python 2
+            return s
+
+    def replace(src, dst):
+        """os.replace fallback; atomic on POSIX, best effort on Windows"""
+        try:
+            os.rename(src, dst)
+        except OSError:  # destination exists (Windows only)
+            os.remove(dst)
+            os.rename(src, dst)
+
+    try:
+        from scandir import scandir
+    except ImportError:
+        # fallback on listdir, at the cost of one stat call per file.
+        class _DirEntry(object):
+            """Minimal stand-in for the os.DirEntry interface"""
+
+            def __init__(self, dirpath, name):
+                self.name = name
+                self.path = os.path.join(dirpath, name)
+
+            def stat(self):
+                return os.stat(self.path)
+
+            def is_file(self):
+                return os.path.isfile(self.path)
+
+        def scandir(path):
+            for name in os.listdir(path):
+                yield _DirEntry(path, name)
+
+    def lru_cache(maxsize=128):
+        """Simplified functools.lru_cache (py3.2+); unbounded memoization
+        of functions of one (hashable) positional argument.
+        """
+        def decorator(fun):
+            cache = {}
+
+            def wrapper(arg):
+                try:
+                    return cache[arg]
+                except KeyError:
+                    cache[arg] = fun(arg)
+                    return cache[arg]
+            return wrapper
+        return decorator
+
     class StdIO(io.BytesIO):
         """Enable printing the streams received by a BytesIO instance"""
         def __init__(self, *args, **kwargs):
@@ -80,6 +133,11 @@ else:
     def u_maybe(s):
         return s
 
+    uintern = sys.intern
+    replace = os.replace
+    scandir = os.scandir
+    from functools import lru_cache
+
     class StdIO(io.BytesIO):
         """Enable printing the streams received by a BytesIO instance"""
         def __init__(self, *args, **kwargs):
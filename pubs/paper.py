@@ -4,7 +4,7 @@ from dateutil.parser import parse as datetime_parse
 from bibtexparser.customization import convert_to_unicode
 
 from . import bibstruct
-from .p3 import ustr
+from .p3 import uintern, ustr
 
 
 DEFAULT_META = {'docfile': None, 'tags': set()}
@@ -30,11 +30,46 @@ class Paper(object):
         in a pythonic manner.
     """
 
-    def __init__(self, citekey, bibdata, metadata=None):
-        self.citekey = citekey
-        self.metadata = _clean_metadata(metadata)
-        self.bibdata = bibdata
-        bibstruct.check_citekey(self.citekey)
+    def __init__(self, citekey, bibdata=None, metadata=None,
+                 bibdata_loader=None, metadata_loader=None):
+        """:param bibdata_loader:  a callable returning the bibdata; if
+                                   provided instead of bibdata, the bibdata
+                                   is only loaded when first accessed.
+           :param metadata_loader: same, for the metadata.
+        """
+        bibstruct.check_citekey(citekey)
+        self.citekey = uintern(citekey)
+        if metadata is None and metadata_loader is not None:
+            self._metadata = None
+            self._metadata_loader = metadata_loader
+        else:
+            self.metadata = metadata
+        self._bibdata = bibdata
+        self._bibdata_loader = bibdata_loader
+
+    @property
+    def bibdata(self):
+        if self._bibdata is None and self._bibdata_loader is not None:
+            self._bibdata = self._bibdata_loader()
+            self._bibdata_loader = None
+        return self._bibdata
+
+    @bibdata.setter
+    def bibdata(self, value):
+        self._bibdata = value
+        self._bibdata_loader = None
+
+    @property
+    def metadata(self):
+        if self._metadata is None and self._metadata_loader is not None:
+            self._metadata = _clean_metadata(self._metadata_loader())
+            self._metadata_loader = None
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value):
+        self._metadata = _clean_metadata(value)
+        self._metadata_loader = None
 
     def __eq__(self, other):
         return (isinstance(self, Paper) and type(other) is type(self)
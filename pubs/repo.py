@@ -6,10 +6,26 @@ from . import events
 from .datacache import DataCache
 from .paper import Paper
 from .content import system_path
+from .p3 import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _base27_compute(n):
+    chars = []
+    while n:
+        n, r = divmod(n - 1, 26)
+        chars.append(chr(ord('a') + r))
+    return ''.join(reversed(chars))
+
+
+_BASE27_TABLE = tuple(_base27_compute(n) for n in range(1024))
 
 
 def _base27(n):
-    return _base27((n - 1) // 26) + chr(ord('a') + ((n - 1) % 26)) if n else ''
+    try:
+        return _BASE27_TABLE[n]
+    except IndexError:
+        return _base27_compute(n)
 
 
 class CiteKeyError(Exception):
@@ -55,9 +71,11 @@ class Repository(object):
         """ Allows to use 'if citekey in repo' pattern
 
         The convention is that the paper is in the repository
-        if and only if a bibfile is in the repository.
+        if and only if a bibfile is in the repository. The citekeys
+        are enumerated from the bibfiles, so after the first listing
+        this is an in-memory set lookup.
         """
-        return self.databroker.exists(citekey)
+        return citekey in self.citekeys
 
     def __len__(self):
         """Warning: costly the first time."""
@@ -65,7 +83,7 @@ class Repository(object):
 
     # papers
     def all_papers(self):
-        for key in self.citekeys:
+        for key in sorted(self.citekeys):
             yield self.pull_paper(key)
 
     def citekeys_from_prefix(self, prefix):
@@ -74,12 +92,18 @@ class Repository(object):
                      if citekey.startswith(prefix))
 
     def pull_paper(self, citekey):
-        """Load a paper by its citekey from disk, if necessary."""
+        """Load a paper by its citekey from disk, if necessary.
+
+        Both the metadata and the bibdata are loaded lazily: nothing is
+        read or parsed before the corresponding attribute is accessed.
+        The membership check below is an in-memory set lookup.
+        """
         if citekey in self:
-            return Paper.from_bibentry(
-                self.databroker.pull_bibentry(citekey),
-                citekey=citekey,
-                metadata=self.databroker.pull_metadata(citekey))
+            return Paper(
+                citekey,
+                metadata_loader=lambda: self.databroker.pull_metadata(citekey),
+                bibdata_loader=lambda: bibstruct.get_entry(
+                    self.databroker.pull_bibentry(citekey))[1])
         else:
             raise CiteKeyNotFound(citekey)
 
@@ -100,6 +124,30 @@ class Repository(object):
         if event:
             events.AddEvent(paper.citekey).send()
 
+    def push_papers(self, papers, overwrite=False, event=True):
+        """ Push a batch of papers to disk at once.
+
+            Citekeys are validated and checked for collisions before
+            anything is written, so a bad entry aborts the batch before it
+            is half-applied. Events are sent once every paper has been
+            written, and the cache is flushed a single time at the end
+            of the batch.
+        """
+        papers = list(papers)
+        batch_keys = set()
+        for paper in papers:
+            bibstruct.check_citekey(paper.citekey)
+            if paper.citekey in batch_keys or (
+                    not overwrite and paper.citekey in self):
+                raise CiteKeyCollision(paper.citekey)
+            batch_keys.add(paper.citekey)
+        for paper in papers:
+            self.push_paper(paper, overwrite=True, event=False)
+        if event:
+            for paper in papers:
+                events.AddEvent(paper.citekey).send()
+        self.databroker.flush_cache()
+
     def remove_paper(self, citekey, remove_doc=True, event=True):
         """ Remove a paper. Is silent if nothing needs to be done."""
         if event:
@@ -202,13 +250,19 @@ class Repository(object):
         """
         if not bibstruct.valid_citekey(base_key):
             base_key = bibstruct.generate_citekey(bibentry)
+        # only the suffixes of colliding citekeys matter; checking
+        # membership on them avoids hashing the full keys on every try.
+        suffixes = {citekey[len(base_key):] for citekey in self.citekeys
+                    if citekey.startswith(base_key)}
         for n in itertools.count():
-            if not base_key + _base27(n) in self.citekeys:
+            if _base27(n) not in suffixes:
                 return base_key + _base27(n)
 
     def get_tags(self):
-        """FIXME: bibdata doesn't need to be read."""
-        tags = set()
-        for p in self.all_papers():
-            tags = tags.union(p.tags)
-        return tags
+        """Return the set of all tags in the repository.
+
+        Only reads the metadata files; the bibtex files, which are much
+        more expensive to parse, are not touched.
+        """
+        return set().union(*(self.databroker.pull_metadata(citekey).get('tags', ())
+                             for citekey in self.citekeys))
@@ -69,6 +69,23 @@ class TestDataBroker(fake_env.TestFakeFs):
 
             db.remove_doc('docsdir://Page99.pdf')
 
+    def test_citekeys(self):
+
+        ende = endecoder.EnDecoder()
+        page99_bibentry = ende.decode_bibdata(str_fixtures.bibtex_raw0)
+
+        for db_class in [databroker.DataBroker, datacache.DataCache]:
+            self.reset_fs()
+
+            db = db_class('tmp', 'tmp/doc', create=True)
+            self.assertEqual(db.citekeys(), set())
+
+            db.push_bibentry('citekey1', page99_bibentry)
+            db.push_bibentry('citekey2', page99_bibentry)
+            self.assertEqual(db.citekeys(), {'citekey1', 'citekey2'})
+            # second call may be answered from the citekeys cache.
+            self.assertEqual(db.citekeys(), {'citekey1', 'citekey2'})
+
     def test_push_pull_cache(self):
         db = databroker.DataBroker('tmp', 'tmp/doc', create=True)
         data_in = {'a': 1}
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+import unittest
+
+import bibtexparser as bp
+
+import dotdot
+from pubs import endecoder, _fastbib
+from pubs.endecoder import customizations
+
+from str_fixtures import (bibtex_raw0, turing_bib, bibtex_month, not_bibtex,
+                          bibtex_with_latex)
+
+
+def bibtexparser_decode(bibdata):
+    """The full parser the fast path must agree with."""
+    return bp.bparser.BibTexParser(
+        bibdata, common_strings=True, customization=customizations,
+        homogenize_fields=True).get_entry_dict()
+
+
+class TestFastBib(unittest.TestCase):
+
+    def roundtrip(self, bibraw):
+        """Re-encode with pubs' writer and compare both parsers on it."""
+        coder = endecoder.EnDecoder()
+        emitted = coder.encode_bibdata(coder.decode_bibdata(bibraw))
+        fast = _fastbib.decode(emitted, customization=customizations)
+        self.assertEqual(dict(fast), dict(bibtexparser_decode(emitted)))
+
+    def test_matches_bibtexparser_on_emitted_bibtex(self):
+        for bibraw in [bibtex_raw0, turing_bib, bibtex_with_latex]:
+            self.roundtrip(bibraw)
+
+    def test_matches_bibtexparser_on_raw_fixture(self):
+        fast = _fastbib.decode(turing_bib, customization=customizations)
+        self.assertEqual(dict(fast), dict(bibtexparser_decode(turing_bib)))
+
+    def test_unsupported_month_abbreviation(self):
+        # `month = dec` requires string interpolation.
+        with self.assertRaises(_fastbib.UnsupportedBibtex):
+            _fastbib.decode(bibtex_month)
+
+    def test_unsupported_quoted_values(self):
+        bibraw = '@article{Doe2013,\n author = "Doe, John",\n}\n'
+        with self.assertRaises(_fastbib.UnsupportedBibtex):
+            _fastbib.decode(bibraw)
+
+    def test_unsupported_garbage(self):
+        for bibraw in [not_bibtex, '', 'hello', '@article{Doe2013']:
+            with self.assertRaises(_fastbib.UnsupportedBibtex):
+                _fastbib.decode(bibraw)
+
+    def test_decode_bibdata_takes_fast_path_and_falls_back(self):
+        coder = endecoder.EnDecoder()
+        # both a pubs-emitted file and an unsupported one must decode.
+        entry = coder.decode_bibdata(bibtex_month)
+        emitted = coder.encode_bibdata(coder.decode_bibdata(bibtex_raw0))
+        self.assertEqual(coder.decode_bibdata(emitted),
+                         coder.decode_bibdata(bibtex_raw0))
+        self.assertEqual(entry['Goyal2017']['month'], 'December')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -68,6 +68,22 @@ class TestPushPaper(TestRepo):
         self.assertTrue(now < retrieved['added'])
 
 
+class TestPushPapers(TestRepo):
+
+    def test_pushes_all_papers(self):
+        self.repo.push_papers([Paper.from_bibentry(fixtures.doe_bibentry),
+                               Paper.from_bibentry(fixtures.franny_bibentry)])
+        self.assertIn('Doe2013', self.repo)
+        self.assertIn('Franny1961', self.repo)
+
+    def test_aborts_batch_on_collision(self):
+        with self.assertRaises(CiteKeyCollision):
+            self.repo.push_papers(
+                [Paper.from_bibentry(fixtures.doe_bibentry),
+                 Paper.from_bibentry(fixtures.turing_bibentry)])
+        self.assertNotIn('Doe2013', self.repo)
+
+
 class TestUpdatePaper(TestRepo):
 
     def test_updates_same_key(self):
@@ -91,5 +107,14 @@ class TestUpdatePaper(TestRepo):
     # TODO: should also check that associated files are updated
 
 
+class TestGetTags(TestRepo):
+
+    def test_get_tags(self):
+        self.assertEqual(self.repo.get_tags(), set())
+        self.repo.push_paper(Paper.from_bibentry(
+            fixtures.doe_bibentry, metadata={'tags': ['a', 'b']}))
+        self.assertEqual(self.repo.get_tags(), set(['a', 'b']))
+
+
 if __name__ == '__main__':
     unittest.main()